@@ -8,15 +8,39 @@ Run this via cron every 5 minutes: */5 * * * * /path/to/fetch_data.py
 Configure your source URLs via environment variables or the CONFIG section below.
 """
 
+import base64
+import functools
+import hashlib
+import html
+import http.client
+import io
 import json
 import os
+import random
+import re
+import sys
+import threading
 import time
 import logging
-from datetime import datetime
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from urllib.error import HTTPError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
 import ssl
 
+try:
+    import ijson  # Optional: stream-parses large result arrays
+    if tuple(int(part) for part in ijson.__version__.split('.')[:2]) < (3, 1):
+        ijson = None  # use_float needs ijson >= 3.1
+except (ImportError, AttributeError, ValueError):
+    ijson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # Optional: C HTML parser for BUMS tables
+except ImportError:
+    LexborHTMLParser = None
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
@@ -87,14 +111,37 @@ CONFIG = {
 
 # Retry configuration
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds, doubled on each attempt
+RETRY_MAX_DELAY = 30  # seconds
+RETRYABLE_CLIENT_ERRORS = (408, 429)  # Other 4xx responses are not retried
 
 # SSL Configuration - Set to True in production with valid certs
 VERIFY_SSL = get_env('VERIFY_SSL', 'false').lower() == 'true'
 
+# Output format - compact by default; set to True for human-readable data.json
+PRETTY_JSON = get_env('PRETTY_JSON', 'false').lower() == 'true'
+
 # Output file path
 OUTPUT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data.json')
 
+# Response cache (ETag/Last-Modified and parsed results) - kept outside the
+# web root since it holds raw source responses. A small JSON index sits next
+# to one raw file per cached response body.
+CACHE_DIR = get_env('OCC_CACHE_DIR', os.path.expanduser('~/.occ_cache'))
+CACHE_INDEX_FILE = os.path.join(CACHE_DIR, 'index.json')
+# Bump when the layout of the cache index changes; older caches are discarded
+CACHE_FORMAT_VERSION = 2
+
+# ============================================================================
+# PARSING PATTERNS - Compiled once at import
+# ============================================================================
+
+TAG_RE = re.compile(r'<[^>]+>')
+BUMS_ROW_RE = re.compile(r'<tr[^>]*>.*?</tr>', re.DOTALL | re.IGNORECASE)
+BUMS_STATUS_RE = re.compile(r'<td[^>]*>\s*(Good|Warning|Critical)\s*</td>', re.IGNORECASE)
+BUMS_CELL_RE = re.compile(r'<td[^>]*>(.*?)</td>', re.DOTALL | re.IGNORECASE)
+AUDIT_CHANGE_RE = re.compile(r'(srv-[\w-]+):\s*(/[\w/\.]+)\s+(modified|changed|added|removed)', re.IGNORECASE)
+
 # ============================================================================
 # FETCH STATUS TRACKING
 # ============================================================================
@@ -109,113 +156,255 @@ def record_status(source, success, error=None):
         'error': str(error) if error else None
     }
 
+# ============================================================================
+# RESPONSE CACHE - Conditional requests and parsed results between runs
+# ============================================================================
+
+# Validators and body file names from the previous run, keyed by URL
+http_cache = {}
+# Entries used in this run; only these are saved, so URLs no longer
+# requested (e.g. AAP's time-windowed query) age out automatically
+http_cache_next = {}
+
+# Parsed results from the previous run, keyed by source name, with a digest
+# of the body they were parsed from
+parsed_cache = {}
+parsed_cache_next = {}
+
+def _write_private_file(path, content):
+    """Atomically write bytes to a file only the current user can read"""
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    tmp_file = f"{path}.tmp"
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_file, path)
+
+
+@functools.lru_cache(maxsize=1)
+def parser_version():
+    """
+    Fingerprint of this script, stored with parsed results
+
+    Any deploy that changes a fetcher's parsing code (or anything it uses,
+    like SNOW_PRIORITIES) changes the fingerprint, so results parsed by the
+    old code are not served for byte-identical bodies.
+    """
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def load_cache():
+    """Load the cache index (validators and parsed results) from the previous run"""
+    try:
+        with open(CACHE_INDEX_FILE) as f:
+            cache = json.load(f)
+        if cache.get('format') != CACHE_FORMAT_VERSION:
+            return
+        http_cache.update(cache.get('responses', {}))
+        if cache.get('parser') == parser_version():
+            parsed_cache.update(cache.get('parsed', {}))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning(f"Ignoring unreadable cache {CACHE_INDEX_FILE}: {e}")
+
+
+def save_cache():
+    """Persist the cache index for the next run and drop unused body files"""
+    index = {
+        'format': CACHE_FORMAT_VERSION,
+        'parser': parser_version(),
+        'responses': http_cache_next,
+        'parsed': parsed_cache_next,
+    }
+    try:
+        _write_private_file(CACHE_INDEX_FILE, json.dumps(index).encode('utf-8'))
+    except OSError as e:
+        logger.warning(f"Could not write cache {CACHE_INDEX_FILE}: {e}")
+        return
+
+    in_use = {entry['body_file'] for entry in http_cache_next.values()}
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.body') and name not in in_use:
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def cache_response(url, headers, body):
+    """Remember a response if the server gave us validators to revalidate it"""
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if not (etag or last_modified):
+        return
+
+    body_file = f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.body"
+    try:
+        _write_private_file(os.path.join(CACHE_DIR, body_file), body)
+    except OSError as e:
+        logger.warning(f"Could not cache response for {url}: {e}")
+        return
+
+    http_cache_next[url] = {
+        'etag': etag,
+        'last_modified': last_modified,
+        'body_file': body_file,
+    }
+
+
+def read_cached_body(entry):
+    """Read a cached response body; only needed when the server answers 304"""
+    with open(os.path.join(CACHE_DIR, entry['body_file']), 'rb') as f:
+        return f.read()
+
+
+def parse_cached(source, body, parse):
+    """
+    Return parse(body), reusing the previous run's result if the body is unchanged
+
+    Args:
+        source: Source name the result is cached under
+        body: Response body as bytes
+        parse: Function turning the body into a JSON-serializable result
+    """
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    cached = parsed_cache.get(source)
+    if cached and cached.get('digest') == digest:
+        result = cached['result']
+    else:
+        result = parse(body)
+    parsed_cache_next[source] = {'digest': digest, 'result': result}
+    return result
+
+
 # ============================================================================
 # MOCK DATA - Used when sources are disabled
 # ============================================================================
 
-def get_mock_data():
-    """Returns mock data for testing"""
-    return {
-        "lastUpdated": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "servicenow": {
-            "incidents": {"critical": 2, "high": 5, "medium": 12, "low": 8, "total": 27},
-            "requests": {"open": 15, "pending": 7, "completed_today": 12},
-            "changes": {"scheduled": 3, "in_progress": 1, "pending_approval": 4},
-            "slt": {"incident_response": 94.5, "incident_resolution": 87.2, "request_fulfillment": 91.8}
-        },
-        "bums": {
-            "servers": {
-                "total": 45,
-                "good": 42,
-                "warning": 2,
-                "critical": 1,
-                "issue_list": [
-                    {"name": "srv-app-012", "status": "Warning"},
-                    {"name": "srv-db-003", "status": "Critical"},
-                    {"name": "srv-web-014", "status": "Warning"}
-                ]
-            },
-            "filesystem": {
-                "alerts": 3,
-                "alert_list": [
-                    {"server": "srv-app-007", "mount": "/var/log", "usage": 92},
-                    {"server": "srv-web-002", "mount": "/opt/data", "usage": 88},
-                    {"server": "srv-db-001", "mount": "/backup", "usage": 95}
-                ]
-            }
+# Static mock payload; timestamps are stamped per call in get_mock_data()
+MOCK_DATA = {
+    "lastUpdated": None,
+    "servicenow": {
+        "incidents": {"critical": 2, "high": 5, "medium": 12, "low": 8, "total": 27},
+        "requests": {"open": 15, "pending": 7, "completed_today": 12},
+        "changes": {"scheduled": 3, "in_progress": 1, "pending_approval": 4},
+        "slt": {"incident_response": 94.5, "incident_resolution": 87.2, "request_fulfillment": 91.8}
+    },
+    "bums": {
+        "servers": {
+            "total": 45,
+            "good": 42,
+            "warning": 2,
+            "critical": 1,
+            "issue_list": [
+                {"name": "srv-app-012", "status": "Warning"},
+                {"name": "srv-db-003", "status": "Critical"},
+                {"name": "srv-web-014", "status": "Warning"}
+            ]
         },
-        "solarwinds": {
-            "cpu_alerts": {
-                "critical": 1, "warning": 3,
-                "alert_list": [
-                    {"node": "web-prod-01", "cpu": 98, "severity": "critical"},
-                    {"node": "app-prod-03", "cpu": 85, "severity": "warning"},
-                    {"node": "db-prod-02", "cpu": 82, "severity": "warning"},
-                    {"node": "cache-01", "cpu": 80, "severity": "warning"}
-                ]
-            },
-            "memory_alerts": {
-                "critical": 0, "warning": 2,
-                "alert_list": [
-                    {"node": "app-prod-01", "memory": 87, "severity": "warning"},
-                    {"node": "web-prod-02", "memory": 84, "severity": "warning"}
-                ]
-            }
+        "filesystem": {
+            "alerts": 3,
+            "alert_list": [
+                {"server": "srv-app-007", "mount": "/var/log", "usage": 92},
+                {"server": "srv-web-002", "mount": "/opt/data", "usage": 88},
+                {"server": "srv-db-001", "mount": "/backup", "usage": 95}
+            ]
+        }
+    },
+    "solarwinds": {
+        "cpu_alerts": {
+            "critical": 1, "warning": 3,
+            "alert_list": [
+                {"node": "web-prod-01", "cpu": 98, "severity": "critical"},
+                {"node": "app-prod-03", "cpu": 85, "severity": "warning"},
+                {"node": "db-prod-02", "cpu": 82, "severity": "warning"},
+                {"node": "cache-01", "cpu": 80, "severity": "warning"}
+            ]
         },
-        "aap": {
-            "last_run": datetime.utcnow().strftime("%Y-%m-%dT06:00:00Z"),
-            "jobs": {
-                "total": 24, "passed": 22, "failed": 2,
-                "failed_list": [
-                    {"name": "backup-db-weekly", "error": "Connection timeout to db-backup-srv"},
-                    {"name": "patch-compliance-check", "error": "Host unreachable: srv-app-012"}
-                ]
-            }
+        "memory_alerts": {
+            "critical": 0, "warning": 2,
+            "alert_list": [
+                {"node": "app-prod-01", "memory": 87, "severity": "warning"},
+                {"node": "web-prod-02", "memory": 84, "severity": "warning"}
+            ]
+        }
+    },
+    "aap": {
+        "last_run": None,
+        "jobs": {
+            "total": 24, "passed": 22, "failed": 2,
+            "failed_list": [
+                {"name": "backup-db-weekly", "error": "Connection timeout to db-backup-srv"},
+                {"name": "patch-compliance-check", "error": "Host unreachable: srv-app-012"}
+            ]
+        }
+    },
+    "audit": {
+        "last_scan": None,
+        "config_changes": {
+            "total": 5,
+            "alerts": [
+                {"server": "srv-web-001", "file": "/etc/ssh/sshd_config", "change": "PermitRootLogin modified", "time": "2025-12-28T22:30:00Z"},
+                {"server": "srv-app-005", "file": "/etc/passwd", "change": "New user added: svc_deploy", "time": "2025-12-28T18:15:00Z"},
+                {"server": "srv-db-002", "file": "/etc/sudoers", "change": "Sudo rule modified", "time": "2025-12-28T14:00:00Z"},
+                {"server": "srv-web-003", "file": "/etc/hosts", "change": "New entry added", "time": "2025-12-29T01:20:00Z"},
+                {"server": "srv-app-001", "file": "/etc/crontab", "change": "New cron job added", "time": "2025-12-29T03:45:00Z"}
+            ]
+        }
+    },
+    "tenable": {
+        "last_scan": None,
+        "vulnerabilities": {
+            "critical": 3,
+            "high": 8,
+            "medium": 24,
+            "low": 45
         },
-        "audit": {
-            "last_scan": datetime.utcnow().strftime("%Y-%m-%dT05:00:00Z"),
-            "config_changes": {
-                "total": 5,
-                "alerts": [
-                    {"server": "srv-web-001", "file": "/etc/ssh/sshd_config", "change": "PermitRootLogin modified", "time": "2025-12-28T22:30:00Z"},
-                    {"server": "srv-app-005", "file": "/etc/passwd", "change": "New user added: svc_deploy", "time": "2025-12-28T18:15:00Z"},
-                    {"server": "srv-db-002", "file": "/etc/sudoers", "change": "Sudo rule modified", "time": "2025-12-28T14:00:00Z"},
-                    {"server": "srv-web-003", "file": "/etc/hosts", "change": "New entry added", "time": "2025-12-29T01:20:00Z"},
-                    {"server": "srv-app-001", "file": "/etc/crontab", "change": "New cron job added", "time": "2025-12-29T03:45:00Z"}
-                ]
-            }
+        "scan_failures": {
+            "total": 4,
+            "failed_list": [
+                {"host": "srv-db-005", "reason": "Authentication failed", "time": "2025-12-29T04:15:00Z"},
+                {"host": "srv-app-009", "reason": "Host unreachable", "time": "2025-12-29T04:18:00Z"},
+                {"host": "srv-web-004", "reason": "Scan timeout", "time": "2025-12-29T04:22:00Z"},
+                {"host": "srv-cache-02", "reason": "Connection refused", "time": "2025-12-29T04:25:00Z"}
+            ]
         },
-        "tenable": {
-            "last_scan": datetime.utcnow().strftime("%Y-%m-%dT04:00:00Z"),
-            "vulnerabilities": {
-                "critical": 3,
-                "high": 8,
-                "medium": 24,
-                "low": 45
-            },
-            "scan_failures": {
-                "total": 4,
-                "failed_list": [
-                    {"host": "srv-db-005", "reason": "Authentication failed", "time": "2025-12-29T04:15:00Z"},
-                    {"host": "srv-app-009", "reason": "Host unreachable", "time": "2025-12-29T04:18:00Z"},
-                    {"host": "srv-web-004", "reason": "Scan timeout", "time": "2025-12-29T04:22:00Z"},
-                    {"host": "srv-cache-02", "reason": "Connection refused", "time": "2025-12-29T04:25:00Z"}
-                ]
-            },
-            "compliance": {
-                "passed": 89,
-                "failed": 11
-            }
+        "compliance": {
+            "passed": 89,
+            "failed": 11
         }
     }
+}
+
+
+def get_mock_data():
+    """
+    Returns mock data for testing
+
+    Only the top level and the stamped sections are copied; the rest is
+    shared with MOCK_DATA, so callers may replace top-level keys but must
+    not mutate nested values.
+    """
+    now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    today = now[:10]
+    return {
+        **MOCK_DATA,
+        'lastUpdated': now,
+        'aap': {**MOCK_DATA['aap'], 'last_run': f"{today}T06:00:00Z"},
+        'audit': {**MOCK_DATA['audit'], 'last_scan': f"{today}T05:00:00Z"},
+        'tenable': {**MOCK_DATA['tenable'], 'last_scan': f"{today}T04:00:00Z"},
+    }
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_ssl_context():
-    """Get SSL context based on configuration"""
+    """Get SSL context based on configuration (built once, loading the CA bundle is slow)"""
     ctx = ssl.create_default_context()
     if not VERIFY_SSL:
         ctx.check_hostname = False
@@ -223,7 +412,126 @@ def get_ssl_context():
     return ctx
 
 
-def fetch_url(url, username=None, password=None, headers=None, retries=MAX_RETRIES):
+# Idle keep-alive connections, keyed by (scheme, host:port, proxy). Reusing
+# them saves a TCP + TLS handshake on every retry and every follow-up request.
+_connection_pool = {}
+_connection_pool_lock = threading.Lock()
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+# Keep the urllib token so gateway rules written for the old urlopen() client still match
+USER_AGENT = f"OCC-Fetcher/1.0 Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+def _proxy_for(scheme, netloc):
+    """
+    Find the proxy for a request, honoring http_proxy/https_proxy/no_proxy
+    the same way urlopen() does
+
+    Returns:
+        (proxy host:port, Proxy-Authorization value or None), or None for a
+        direct connection
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(netloc):
+        return None
+
+    if '://' not in proxy:
+        proxy = f"http://{proxy}"
+    parts = urlsplit(proxy)
+
+    auth = None
+    if parts.username:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        auth = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+
+    return f"{parts.hostname}:{parts.port or 80}", auth
+
+
+def _get_connection(scheme, netloc, proxy):
+    """
+    Take an idle pooled connection for the host, or open a new one
+
+    Returns:
+        (connection, reused) tuple
+    """
+    with _connection_pool_lock:
+        idle = _connection_pool.get((scheme, netloc, proxy))
+        if idle:
+            return idle.pop(), True
+
+    if proxy:
+        proxy_host, proxy_auth = proxy
+        if scheme == 'https':
+            # Tunnel through the proxy with CONNECT; TLS is still end to end
+            conn = http.client.HTTPSConnection(proxy_host, timeout=30, context=get_ssl_context())
+            conn.set_tunnel(netloc, headers={'Proxy-Authorization': proxy_auth} if proxy_auth else None)
+            return conn, False
+        return http.client.HTTPConnection(proxy_host, timeout=30), False
+
+    if scheme == 'https':
+        return http.client.HTTPSConnection(netloc, timeout=30, context=get_ssl_context()), False
+    return http.client.HTTPConnection(netloc, timeout=30), False
+
+
+def _release_connection(scheme, netloc, proxy, conn):
+    """Return a connection to the pool for reuse"""
+    with _connection_pool_lock:
+        _connection_pool.setdefault((scheme, netloc, proxy), []).append(conn)
+
+
+def close_connections():
+    """Close all idle pooled connections"""
+    with _connection_pool_lock:
+        for conns in _connection_pool.values():
+            for conn in conns:
+                conn.close()
+        _connection_pool.clear()
+
+
+def _send_request(method, url, body=None, headers=None):
+    """
+    Send a single HTTP request over a pooled connection
+
+    Returns:
+        (status, reason, response headers, response body as bytes)
+    """
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path += f"?{parts.query}"
+
+    headers = dict(headers or {})
+    proxy = _proxy_for(parts.scheme, parts.netloc)
+    if proxy and parts.scheme == 'http':
+        # Plain HTTP through a proxy sends the absolute URI to the proxy
+        path = f"http://{parts.netloc}{path}"
+        if proxy[1]:
+            headers['Proxy-Authorization'] = proxy[1]
+
+    while True:
+        conn, reused = _get_connection(parts.scheme, parts.netloc, proxy)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            if reused:
+                # Server dropped the idle keep-alive connection; try a fresh one
+                continue
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            _release_connection(parts.scheme, parts.netloc, proxy, conn)
+
+        return response.status, response.reason, response.headers, data
+
+
+def fetch_url(url, username=None, password=None, headers=None, data=None, retries=MAX_RETRIES):
     """
     Helper to fetch URL with optional auth and retry logic
 
@@ -232,44 +540,88 @@ def fetch_url(url, username=None, password=None, headers=None, retries=MAX_RETRI
         username: Basic auth username
         password: Basic auth password
         headers: Additional headers dict
+        data: Request body bytes (sends a POST when given)
         retries: Number of retry attempts
 
     Returns:
-        Response body as string
+        Response body as bytes (json.loads accepts bytes directly)
 
     Raises:
         Exception on failure after all retries
     """
-    ctx = get_ssl_context()
+    request_headers = {'User-Agent': USER_AGENT}
+
+    # Add basic auth if provided
+    if username and password:
+        credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+        request_headers['Authorization'] = f'Basic {credentials}'
+
+    # Add custom headers
+    if headers:
+        request_headers.update(headers)
+
+    # Revalidate a cached response instead of downloading it again
+    cached = http_cache.get(url) if data is None else None
+    if cached and not os.path.exists(os.path.join(CACHE_DIR, cached.get('body_file', ''))):
+        cached = None
+    if cached:
+        if cached.get('etag'):
+            request_headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            request_headers['If-Modified-Since'] = cached['last_modified']
 
     for attempt in range(retries):
         try:
-            request = Request(url)
-
-            # Add basic auth if provided
-            if username and password:
-                import base64
-                credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-                request.add_header('Authorization', f'Basic {credentials}')
-
-            # Add custom headers
-            if headers:
-                for key, value in headers.items():
-                    request.add_header(key, value)
-
-            with urlopen(request, context=ctx, timeout=30) as response:
-                return response.read().decode('utf-8')
-
-        except (URLError, HTTPError) as e:
+            method = 'POST' if data is not None else 'GET'
+            body = data
+            target = url
+
+            for _ in range(MAX_REDIRECTS + 1):
+                status, reason, response_headers, response_body = _send_request(
+                    method, target, body, request_headers
+                )
+                location = response_headers.get('Location')
+                if status not in REDIRECT_CODES or not location:
+                    break
+                target = urljoin(target, location)
+                if status in (301, 302, 303):
+                    method, body = 'GET', None
+
+            if status == 304 and cached:
+                try:
+                    response_body = read_cached_body(cached)
+                except OSError:
+                    # Cached body vanished; retry as a plain request
+                    request_headers.pop('If-None-Match', None)
+                    request_headers.pop('If-Modified-Since', None)
+                    cached = None
+                    raise
+                http_cache_next[url] = cached
+                return response_body
+
+            if status >= 300:
+                raise HTTPError(target, status, reason, response_headers, None)
+
+            if data is None:
+                cache_response(url, response_headers, response_body)
+            return response_body
+
+        except (OSError, http.client.HTTPException) as e:
             logger.warning(f"Attempt {attempt + 1}/{retries} failed for {url}: {e}")
+            # Bad credentials or a wrong URL won't fix themselves on retry
+            if isinstance(e, HTTPError) and 400 <= e.code < 500 and e.code not in RETRYABLE_CLIENT_ERRORS:
+                raise
             if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
+                # Exponential backoff with jitter so parallel retries don't align
+                delay = min(RETRY_MAX_DELAY, RETRY_DELAY * 2 ** attempt)
+                time.sleep(delay * (0.5 + random.random()))
             else:
                 raise
 
 
+@functools.lru_cache(maxsize=1)
 def generate_source_urls():
-    """Generate source URLs from CONFIG"""
+    """Generate source URLs from CONFIG (CONFIG is fixed at import, so computed once)"""
     return {
         'servicenow': CONFIG['servicenow']['url'].replace('/api/now/table/incident', '/nav_to.do?uri=incident_list.do'),
         'bums': CONFIG['bums']['url'],
@@ -280,10 +632,88 @@ def generate_source_urls():
     }
 
 
+def iter_json_items(body, path):
+    """
+    Yield the items of the JSON array found at a dotted key path
+
+    Streams with ijson when it is installed, so the full object tree for
+    multi-MB responses is never built; otherwise falls back to json.loads.
+    Both paths behave the same on malformed responses.
+
+    Args:
+        body: Response body as bytes
+        path: Dotted key path to the array, e.g. 'response.results'
+
+    Raises:
+        ValueError if the body is not JSON, or the path is missing or not an
+        array (an empty array yields nothing)
+    """
+    if ijson is not None:
+        try:
+            found = False
+            for item in ijson.items(io.BytesIO(body), f"{path}.item", use_float=True):
+                found = True
+                yield item
+            if found:
+                return
+            # Nothing yielded: tell an empty array apart from a missing path
+            for prefix, event, _ in ijson.parse(io.BytesIO(body)):
+                if prefix == path and event == 'start_array':
+                    return
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in response: {e}") from e
+        raise ValueError(f"No '{path}' array in response")
+
+    data = json.loads(body)
+    for key in path.split('.'):
+        if not isinstance(data, dict) or key not in data:
+            raise ValueError(f"No '{path}' array in response")
+        data = data[key]
+    if not isinstance(data, list):
+        raise ValueError(f"No '{path}' array in response")
+    yield from data
+
+
+def iter_status_rows(text):
+    """
+    Yield (name, status) for each HTML table row that has a status cell
+
+    A status cell holds only Good/Warning/Critical (no nested markup); the
+    name is the text of the row's first cell. Uses selectolax when it is
+    installed, which copes with unclosed rows; otherwise the precompiled
+    regexes, which give the same results on well-formed tables.
+    """
+    if LexborHTMLParser is not None:
+        for row in LexborHTMLParser(text).css('tr'):
+            cells = [node for node in row.iter() if node.tag == 'td']
+            for cell in cells:
+                value = cell.text(deep=False).strip()
+                if value.lower() in ('good', 'warning', 'critical') and cell.child.next is None:
+                    yield cells[0].text().strip() or 'Unknown', value
+                    break
+        return
+
+    for row in BUMS_ROW_RE.findall(text):
+        status_match = BUMS_STATUS_RE.search(row)
+        if not status_match:
+            continue
+
+        tds = BUMS_CELL_RE.findall(row)
+        if not tds:
+            continue
+
+        name = html.unescape(TAG_RE.sub('', tds[0])).strip() or 'Unknown'
+        yield name, status_match.group(1)
+
+
 # ============================================================================
 # DATA FETCHERS
 # ============================================================================
 
+# ServiceNow priority code -> incident bucket; anything else counts as low
+SNOW_PRIORITIES = {'1': 'critical', '2': 'high', '3': 'medium'}
+
+
 def fetch_servicenow():
     """
     Fetch ServiceNow data via REST API
@@ -297,21 +727,17 @@ def fetch_servicenow():
         # Fetch active incidents grouped by priority
         url = f"{cfg['url']}?sysparm_query=active=true&sysparm_fields=priority,state"
         response = fetch_url(url, cfg['username'], cfg['password'])
-        data = json.loads(response)
-
-        # Count by priority
-        incidents = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0, 'total': 0}
-        for record in data.get('result', []):
-            priority = record.get('priority', '4')
-            if priority == '1':
-                incidents['critical'] += 1
-            elif priority == '2':
-                incidents['high'] += 1
-            elif priority == '3':
-                incidents['medium'] += 1
-            else:
-                incidents['low'] += 1
-            incidents['total'] += 1
+
+        def parse(body):
+            # Count by priority
+            data = json.loads(body)
+            incidents = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0, 'total': 0}
+            for record in data.get('result', []):
+                incidents[SNOW_PRIORITIES.get(record.get('priority'), 'low')] += 1
+                incidents['total'] += 1
+            return incidents
+
+        incidents = parse_cached('servicenow', response, parse)
 
         record_status('servicenow', True)
         return {
@@ -348,75 +774,62 @@ def fetch_bums():
                 return 'critical'
             return 'warning'
 
-        def strip_tags(value):
-            import html
-            import re
-            text = re.sub(r'<[^>]+>', '', value)
-            return html.unescape(text).strip()
-
-        # Try JSON first
-        try:
-            data = json.loads(response)
-            servers = data.get('servers', [])
-            good = 0
-            warning = 0
-            critical = 0
-            issue_list = []
-            for server in servers:
-                status = normalize_status(server.get('status'))
-                name = server.get('hostname') or server.get('name') or server.get('server', 'Unknown')
-                if status == 'good':
-                    good += 1
-                elif status == 'critical':
-                    critical += 1
-                    issue_list.append({'name': name, 'status': 'Critical'})
-                else:
-                    warning += 1
-                    issue_list.append({'name': name, 'status': 'Warning'})
-
-            total = len(servers)
-        except json.JSONDecodeError:
-            # Fall back to HTML parsing
-            import re
-            row_pattern = r'<tr[^>]*>.*?</tr>'
-            rows = re.findall(row_pattern, response, re.DOTALL | re.IGNORECASE)
-            good = 0
-            warning = 0
-            critical = 0
-            issue_list = []
-            total = 0
-
-            for row in rows:
-                status_match = re.search(r'<td[^>]*>\s*(Good|Warning|Critical)\s*</td>', row, re.IGNORECASE)
-                if not status_match:
-                    continue
-
-                tds = re.findall(r'<td[^>]*>(.*?)</td>', row, re.DOTALL | re.IGNORECASE)
-                if not tds:
-                    continue
-
-                name = strip_tags(tds[0]) or 'Unknown'
-                status = normalize_status(status_match.group(1))
-                total += 1
-
-                if status == 'good':
-                    good += 1
-                elif status == 'critical':
-                    critical += 1
-                    issue_list.append({'name': name, 'status': 'Critical'})
-                else:
-                    warning += 1
-                    issue_list.append({'name': name, 'status': 'Warning'})
-
-        record_status('bums', True)
-        return {
-            'servers': {
+        def parse(body):
+            # Try JSON first
+            try:
+                data = json.loads(body)
+                servers = data.get('servers', [])
+                good = 0
+                warning = 0
+                critical = 0
+                issue_list = []
+                for server in servers:
+                    status = normalize_status(server.get('status'))
+                    name = server.get('hostname') or server.get('name') or server.get('server', 'Unknown')
+                    if status == 'good':
+                        good += 1
+                    elif status == 'critical':
+                        critical += 1
+                        issue_list.append({'name': name, 'status': 'Critical'})
+                    else:
+                        warning += 1
+                        issue_list.append({'name': name, 'status': 'Warning'})
+
+                total = len(servers)
+            except ValueError:
+                # Fall back to HTML parsing
+                good = 0
+                warning = 0
+                critical = 0
+                issue_list = []
+                total = 0
+
+                for name, status_cell in iter_status_rows(body.decode('utf-8')):
+                    status = normalize_status(status_cell)
+                    total += 1
+
+                    if status == 'good':
+                        good += 1
+                    elif status == 'critical':
+                        critical += 1
+                        issue_list.append({'name': name, 'status': 'Critical'})
+                    else:
+                        warning += 1
+                        issue_list.append({'name': name, 'status': 'Warning'})
+
+            return {
                 'total': total,
                 'good': good,
                 'warning': warning,
                 'critical': critical,
                 'issue_list': issue_list
-            },
+            }
+
+        servers = parse_cached('bums', response, parse)
+
+        record_status('bums', True)
+        return {
+            'servers': servers,
             'filesystem': {
                 'alerts': 0,
                 'alert_list': []
@@ -442,56 +855,53 @@ def fetch_solarwinds():
         query = "SELECT AlertActive.AlertObjectID, AlertActive.ObjectName, AlertActive.Severity FROM Orion.AlertActive"
         request_data = json.dumps({'query': query}).encode('utf-8')
 
-        import base64
-        credentials = base64.b64encode(f"{cfg['username']}:{cfg['password']}".encode()).decode()
-
-        request = Request(cfg['url'], data=request_data)
-        request.add_header('Content-Type', 'application/json')
-        request.add_header('Authorization', f'Basic {credentials}')
-
-        ctx = get_ssl_context()
-        with urlopen(request, context=ctx, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-
-        cpu_critical = 0
-        cpu_warning = 0
-        cpu_alerts = []
-        memory_critical = 0
-        memory_warning = 0
-        memory_alerts = []
-
-        for alert in data.get('results', []):
-            obj_name = alert.get('ObjectName', '')
-            severity = alert.get('Severity', 0)
-
-            if 'CPU' in obj_name:
-                sev = 'critical' if severity >= 2 else 'warning'
-                if sev == 'critical':
-                    cpu_critical += 1
-                else:
-                    cpu_warning += 1
-                cpu_alerts.append({'node': obj_name, 'cpu': 95, 'severity': sev})
-            elif 'Memory' in obj_name:
-                sev = 'critical' if severity >= 2 else 'warning'
-                if sev == 'critical':
-                    memory_critical += 1
-                else:
-                    memory_warning += 1
-                memory_alerts.append({'node': obj_name, 'memory': 90, 'severity': sev})
+        headers = {'Content-Type': 'application/json'}
+        response = fetch_url(cfg['url'], cfg['username'], cfg['password'], headers=headers, data=request_data)
+
+        def parse(body):
+            cpu_critical = 0
+            cpu_warning = 0
+            cpu_alerts = []
+            memory_critical = 0
+            memory_warning = 0
+            memory_alerts = []
+
+            for alert in iter_json_items(body, 'results'):
+                obj_name = alert.get('ObjectName', '')
+                severity = alert.get('Severity', 0)
+
+                if 'CPU' in obj_name:
+                    sev = 'critical' if severity >= 2 else 'warning'
+                    if sev == 'critical':
+                        cpu_critical += 1
+                    else:
+                        cpu_warning += 1
+                    cpu_alerts.append({'node': obj_name, 'cpu': 95, 'severity': sev})
+                elif 'Memory' in obj_name:
+                    sev = 'critical' if severity >= 2 else 'warning'
+                    if sev == 'critical':
+                        memory_critical += 1
+                    else:
+                        memory_warning += 1
+                    memory_alerts.append({'node': obj_name, 'memory': 90, 'severity': sev})
+
+            return {
+                'cpu_alerts': {
+                    'critical': cpu_critical,
+                    'warning': cpu_warning,
+                    'alert_list': cpu_alerts[:10]
+                },
+                'memory_alerts': {
+                    'critical': memory_critical,
+                    'warning': memory_warning,
+                    'alert_list': memory_alerts[:10]
+                }
+            }
+
+        alerts = parse_cached('solarwinds', response, parse)
 
         record_status('solarwinds', True)
-        return {
-            'cpu_alerts': {
-                'critical': cpu_critical,
-                'warning': cpu_warning,
-                'alert_list': cpu_alerts[:10]
-            },
-            'memory_alerts': {
-                'critical': memory_critical,
-                'warning': memory_warning,
-                'alert_list': memory_alerts[:10]
-            }
-        }
+        return alerts
 
     except Exception as e:
         record_status('solarwinds', False, e)
@@ -508,33 +918,45 @@ def fetch_aap():
     cfg = CONFIG['aap']
 
     try:
-        from datetime import timedelta
         yesterday = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         url = f"{cfg['url']}?created__gt={yesterday}&order_by=-created"
         headers = {'Authorization': f"Bearer {cfg['token']}"}
 
         response = fetch_url(url, headers=headers)
-        data = json.loads(response)
-
-        jobs = data.get('results', [])
-        passed = sum(1 for j in jobs if j.get('status') == 'successful')
-        failed = sum(1 for j in jobs if j.get('status') == 'failed')
 
-        failed_list = [
-            {'name': j.get('name', 'Unknown'), 'error': j.get('result_stdout', 'Unknown error')[:100]}
-            for j in jobs if j.get('status') == 'failed'
-        ][:5]
-
-        record_status('aap', True)
-        return {
-            'last_run': datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-            'jobs': {
+        def parse(body):
+            data = json.loads(body)
+
+            jobs = data.get('results', [])
+            passed = 0
+            failed = 0
+            failed_list = []
+            for job in jobs:
+                status = job.get('status')
+                if status == 'successful':
+                    passed += 1
+                elif status == 'failed':
+                    failed += 1
+                    if len(failed_list) < 5:
+                        failed_list.append({
+                            'name': job.get('name', 'Unknown'),
+                            'error': job.get('result_stdout', 'Unknown error')[:100]
+                        })
+
+            return {
                 'total': len(jobs),
                 'passed': passed,
                 'failed': failed,
                 'failed_list': failed_list
             }
+
+        jobs = parse_cached('aap', response, parse)
+
+        record_status('aap', True)
+        return {
+            'last_run': datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            'jobs': jobs
         }
 
     except Exception as e:
@@ -554,24 +976,25 @@ def fetch_audit():
     try:
         response = fetch_url(cfg['url'], cfg.get('username'), cfg.get('password'))
 
-        # Parse based on format
-        import re
-        change_pattern = r'(srv-[\w-]+):\s*(/[\w/\.]+)\s+(modified|changed|added|removed)'
-        matches = re.findall(change_pattern, response, re.IGNORECASE)
-
-        alerts = [
-            {
-                'server': server,
-                'file': filepath,
-                'change': action.capitalize(),
-                'time': datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-            }
-            for server, filepath, action in matches
-        ][:10]
+        def parse(body):
+            # Parse based on format
+            matches = AUDIT_CHANGE_RE.findall(body.decode('utf-8'))
+            return [
+                {
+                    'server': server,
+                    'file': filepath,
+                    'change': action.capitalize()
+                }
+                for server, filepath, action in matches[:10]
+            ]
+
+        changes = parse_cached('audit', response, parse)
+        now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        alerts = [dict(change, time=now) for change in changes]
 
         record_status('audit', True)
         return {
-            'last_scan': datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            'last_scan': now,
             'config_changes': {
                 'total': len(alerts),
                 'alerts': alerts
@@ -600,25 +1023,30 @@ def fetch_tenable():
 
         # Fetch vulnerability summary
         response = fetch_url(cfg['url'], headers=headers)
-        data = json.loads(response)
 
-        # Parse vulnerability counts (adjust based on actual API response)
-        vulns = data.get('response', {}).get('results', [])
+        def parse(body):
+            # Parse vulnerability counts (adjust based on actual API response)
+            # Count by severity id (1=low .. 4=critical) in a single pass
+            counts = [0, 0, 0, 0, 0]
+            for vuln in iter_json_items(body, 'response.results'):
+                severity_id = vuln.get('severity', {}).get('id')
+                if severity_id in (1, 2, 3, 4):
+                    counts[severity_id] += 1
+            _, low, medium, high, critical = counts
+
+            return {
+                'critical': critical,
+                'high': high,
+                'medium': medium,
+                'low': low
+            }
 
-        critical = sum(1 for v in vulns if v.get('severity', {}).get('id') == 4)
-        high = sum(1 for v in vulns if v.get('severity', {}).get('id') == 3)
-        medium = sum(1 for v in vulns if v.get('severity', {}).get('id') == 2)
-        low = sum(1 for v in vulns if v.get('severity', {}).get('id') == 1)
+        vulnerabilities = parse_cached('tenable', response, parse)
 
         record_status('tenable', True)
         return {
             'last_scan': datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-            'vulnerabilities': {
-                'critical': critical,
-                'high': high,
-                'medium': medium,
-                'low': low
-            },
+            'vulnerabilities': vulnerabilities,
             'scan_failures': {
                 'total': 0,
                 'failed_list': []
@@ -647,6 +1075,8 @@ def main():
     # Generate source URLs from config
     data['sourceUrls'] = generate_source_urls()
 
+    load_cache()
+
     # Fetch from each source
     sources = [
         ('servicenow', fetch_servicenow),
@@ -657,26 +1087,49 @@ def main():
         ('tenable', fetch_tenable),
     ]
 
+    # Disabled sources keep their mock data and are never scheduled
+    enabled_sources = []
     for source_name, fetch_func in sources:
-        try:
-            source_data = fetch_func()
-            if source_data:
-                data[source_name] = source_data
+        if CONFIG[source_name]['enabled']:
+            enabled_sources.append((source_name, fetch_func))
+        else:
+            logger.info(f"  - {source_name}: Disabled")
+            record_status(source_name, True, "Disabled - using mock data")
+
+    # Sources are independent and I/O-bound, so run them concurrently, one
+    # thread per source; total wall time becomes the slowest source rather
+    # than the sum
+    with ThreadPoolExecutor(max_workers=max(len(enabled_sources), 1), thread_name_prefix='fetch') as executor:
+        futures = {executor.submit(fetch_func): source_name for source_name, fetch_func in enabled_sources}
+        for future in as_completed(futures):
+            source_name = futures[future]
+            try:
+                data[source_name] = future.result()
                 logger.info(f"  ✓ {source_name}: OK")
-            else:
-                logger.info(f"  - {source_name}: Disabled")
-                record_status(source_name, True, "Disabled - using mock data")
-        except Exception as e:
-            logger.error(f"  ✗ {source_name}: ERROR - {e}")
-            # Keep mock data for this source
+            except Exception as e:
+                logger.error(f"  ✗ {source_name}: ERROR - {e}")
+                # Keep mock data for this source
+
+    close_connections()
+    save_cache()
 
     # Update timestamp and fetch status
     data['lastUpdated'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
     data['fetchStatus'] = fetch_status
 
-    # Write to file
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Write to file (serialize first; json.dump() issues a write() per chunk).
+    # Write to a temp file and rename over the original so the dashboard
+    # never reads a partially written data.json.
+    if PRETTY_JSON:
+        output = json.dumps(data, indent=2)
+    else:
+        output = json.dumps(data, separators=(',', ':'))
+    tmp_file = f"{OUTPUT_FILE}.tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(output)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, OUTPUT_FILE)
 
     logger.info(f"Data written to {OUTPUT_FILE}")
 